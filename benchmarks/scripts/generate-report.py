@@ -10,11 +10,105 @@ Usage:
 """
 
 import argparse
+import contextlib
+import hashlib
 import json
+import os
+import re
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from array import array
 from collections import defaultdict
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Process umask, read once so atomic writes can apply it to their temp files
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def parse_json(data: bytes) -> dict:
+    """Decode JSON bytes, using orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj) -> bytes:
+    """Encode JSON to bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file in the same directory, then rename into place"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file owner-only; give it the mode a plain
+        # open() would have so readers of the outputs aren't locked out
+        os.chmod(tmp_name, 0o666 & ~UMASK)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+# Score files are named {skill_id}_{test_id}_{jury_name}.json
+SCORE_FILE_RE = re.compile(r"^(?P<skill>.+?)_(?P<test_tail>[^_]+)_(?P<jury>[^_]+)\.json$")
+
+# Jury score fields the report reads; everything else is dropped at load
+SCORE_FIELDS = ("error", "winner", "position_map", "reasoning")
+
+# Bump when project_score or the filename tagging in parse_score_files
+# changes shape; the field list and filename pattern are hashed in as well
+SCORE_CACHE_VERSION = 1
+SCORE_CACHE_SCHEMA = hashlib.blake2b(
+    repr((SCORE_CACHE_VERSION, SCORE_FIELDS, SCORE_FILE_RE.pattern)).encode(),
+    digest_size=8
+).hexdigest()
+
+
+def project_score(score_data: dict) -> dict:
+    """Keep only the fields of a jury score that the report aggregates"""
+    projected = {k: score_data[k] for k in SCORE_FIELDS if k in score_data}
+    for side in ("response_a", "response_b"):
+        if isinstance(score_data.get(side), dict):
+            projected[side] = {"benchmark_score": score_data[side].get("benchmark_score")}
+    return projected
+
+
+def parse_score_files(entries: List[os.DirEntry]) -> List[dict]:
+    """Read and parse jury score files, tagging each with its skill/test/jury"""
+    # Reads are syscall-bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        raw_files = list(executor.map(Path.read_bytes, (Path(e.path) for e in entries)))
+
+    jury_scores = []
+    for entry, raw in zip(entries, raw_files):
+        score_data = project_score(parse_json(raw))
+        # Parse filename to get test info; unparseable names fall
+        # through to "unknown" in calculate_statistics
+        match = SCORE_FILE_RE.match(entry.name)
+        if match:
+            score_data["_skill_id"] = match["skill"]
+            score_data["_test_id"] = f"{match['skill']}_{match['test_tail']}"
+            score_data["_jury_name"] = match["jury"]
+        score_data["_file"] = entry.name
+
+        jury_scores.append(score_data)
+
+    return jury_scores
 
 
 def load_run_data(run_id: str) -> tuple:
@@ -27,88 +121,68 @@ def load_run_data(run_id: str) -> tuple:
         print(f"Error: Metadata not found at {metadata_path}")
         return None, None
 
-    with open(metadata_path) as f:
-        metadata = json.load(f)
+    metadata = parse_json(metadata_path.read_bytes())
 
     # Load all jury scores
     scores_dir = base_path / "jury-scores"
-    jury_scores = []
+    if not scores_dir.exists():
+        return metadata, []
 
-    if scores_dir.exists():
-        for score_file in scores_dir.glob("*.json"):
-            with open(score_file) as f:
-                score_data = json.load(f)
-                # Parse filename to get test info
-                parts = score_file.stem.rsplit("_", 1)
-                jury_name = parts[-1]
-                skill_test = parts[0].rsplit("_", 1)
-                skill_id = skill_test[0]
-                test_id = "_".join(skill_test)
+    with os.scandir(scores_dir) as it:
+        entries = [e for e in it if e.name.endswith(".json")]
 
-                score_data["_skill_id"] = skill_id
-                score_data["_test_id"] = test_id
-                score_data["_jury_name"] = jury_name
-                score_data["_file"] = score_file.name
+    # Parsed scores are cached beside the run and reused until any score
+    # file is added, removed or rewritten, or the parsing schema changes
+    cache_path = base_path / "jury-scores.cache.json"
+    newest = max([scores_dir.stat().st_mtime_ns, *(e.stat().st_mtime_ns for e in entries)])
+    if cache_path.exists() and cache_path.stat().st_mtime_ns > newest:
+        cached = parse_json(cache_path.read_bytes())
+        if isinstance(cached, dict) and cached.get("schema") == SCORE_CACHE_SCHEMA:
+            return metadata, cached["scores"]
 
-                jury_scores.append(score_data)
+    jury_scores = parse_score_files(entries)
+
+    write_atomic(cache_path, dump_json({"schema": SCORE_CACHE_SCHEMA, "scores": jury_scores}))
 
     return metadata, jury_scores
 
 
-def calculate_statistics(jury_scores: List[dict]) -> dict:
-    """Calculate aggregate statistics from jury scores"""
+# Winner codes for the columnar score table
+VANILLA, SKILLED, TIE, UNKNOWN = range(4)
+WINNER_NAMES = ("vanilla", "skilled", "tie", "unknown")
 
-    stats = {
-        "overall": {
-            "vanilla_wins": 0,
-            "skilled_wins": 0,
-            "ties": 0,
-            "total": 0,
-            "vanilla_avg_score": [],
-            "skilled_avg_score": [],
-        },
-        "by_skill": defaultdict(lambda: {
-            "vanilla_wins": 0,
-            "skilled_wins": 0,
-            "ties": 0,
-            "total": 0,
-            "vanilla_scores": [],
-            "skilled_scores": [],
-            "tests": defaultdict(lambda: {"jury_results": []})
-        }),
-        "by_jury": defaultdict(lambda: {
-            "vanilla_wins": 0,
-            "skilled_wins": 0,
-            "ties": 0,
-            "total": 0,
-        }),
+
+def build_score_columns(jury_scores: List[dict]) -> dict:
+    """Flatten jury scores into parallel columns, one row per evaluation"""
+
+    columns = {
+        "skill": [],
+        "test": [],
+        "jury": [],
+        "winner": array("b"),
+        "vanilla_score": [],
+        "skilled_score": [],
+        "reasoning": [],
     }
 
     for score in jury_scores:
         if "error" in score:
             continue
 
-        skill_id = score.get("_skill_id", "unknown")
-        test_id = score.get("_test_id", "unknown")
-        jury_name = score.get("_jury_name", "unknown")
         position_map = score.get("position_map", {})
 
         # Determine winner
         winner_position = score.get("winner", "Tie")
-        if winner_position == "A":
-            actual_winner = position_map.get("A", "unknown")
-        elif winner_position == "B":
-            actual_winner = position_map.get("B", "unknown")
+        if winner_position in ("A", "B"):
+            actual_winner = position_map.get(winner_position, "unknown")
+            winner = WINNER_NAMES.index(actual_winner) if actual_winner in ("vanilla", "skilled") else UNKNOWN
         else:
-            actual_winner = "tie"
+            winner = TIE
 
         # Get scores for each contestant
         response_a = score.get("response_a", {})
         response_b = score.get("response_b", {})
 
-        vanilla_score = None
-        skilled_score = None
-
         if position_map.get("A") == "vanilla":
             vanilla_score = response_a.get("benchmark_score")
             skilled_score = response_b.get("benchmark_score")
@@ -116,94 +190,128 @@ def calculate_statistics(jury_scores: List[dict]) -> dict:
             vanilla_score = response_b.get("benchmark_score")
             skilled_score = response_a.get("benchmark_score")
 
-        # Update overall stats
-        stats["overall"]["total"] += 1
-        if actual_winner == "vanilla":
-            stats["overall"]["vanilla_wins"] += 1
-        elif actual_winner == "skilled":
-            stats["overall"]["skilled_wins"] += 1
-        else:
-            stats["overall"]["ties"] += 1
-
-        if vanilla_score is not None:
-            stats["overall"]["vanilla_avg_score"].append(vanilla_score)
-        if skilled_score is not None:
-            stats["overall"]["skilled_avg_score"].append(skilled_score)
-
-        # Update by_skill stats
-        skill_stats = stats["by_skill"][skill_id]
-        skill_stats["total"] += 1
-        if actual_winner == "vanilla":
-            skill_stats["vanilla_wins"] += 1
-        elif actual_winner == "skilled":
-            skill_stats["skilled_wins"] += 1
-        else:
-            skill_stats["ties"] += 1
-
-        if vanilla_score is not None:
-            skill_stats["vanilla_scores"].append(vanilla_score)
-        if skilled_score is not None:
-            skill_stats["skilled_scores"].append(skilled_score)
-
-        skill_stats["tests"][test_id]["jury_results"].append({
-            "jury": jury_name,
-            "winner": actual_winner,
-            "vanilla_score": vanilla_score,
-            "skilled_score": skilled_score,
-            "reasoning": score.get("reasoning", ""),
+        columns["skill"].append(score.get("_skill_id", "unknown"))
+        columns["test"].append(score.get("_test_id", "unknown"))
+        columns["jury"].append(score.get("_jury_name", "unknown"))
+        columns["winner"].append(winner)
+        columns["vanilla_score"].append(vanilla_score)
+        columns["skilled_score"].append(skilled_score)
+        columns["reasoning"].append(score.get("reasoning") or "")
+
+    return columns
+
+
+def factorize(values: List[str]) -> Tuple[array, List[str]]:
+    """Encode values as int codes in first-seen order"""
+    index = {}
+    codes = array("i", (index.setdefault(v, len(index)) for v in values))
+    return codes, list(index)
+
+
+def aggregate(winner: array, group: array, vanilla_score: list, skilled_score: list, n_groups: int) -> List[dict]:
+    """Per-group outcome counts and score sums in one pass over packed columns"""
+    n_codes = len(WINNER_NAMES)
+    wins = [0] * (n_groups * n_codes)
+    vanilla_sum = [0] * n_groups
+    vanilla_count = [0] * n_groups
+    skilled_sum = [0] * n_groups
+    skilled_count = [0] * n_groups
+
+    for code, g, v, s in zip(winner, group, vanilla_score, skilled_score):
+        wins[g * n_codes + code] += 1
+        if v is not None:
+            vanilla_sum[g] += v
+            vanilla_count[g] += 1
+        if s is not None:
+            skilled_sum[g] += s
+            skilled_count[g] += 1
+
+    groups = []
+    for g in range(n_groups):
+        vanilla, skilled, tie, unknown = wins[g * n_codes:(g + 1) * n_codes]
+        groups.append({
+            "vanilla_wins": vanilla,
+            "skilled_wins": skilled,
+            # Unresolvable winners count as ties, as they always have
+            "ties": tie + unknown,
+            "total": vanilla + skilled + tie + unknown,
+            "vanilla_avg": vanilla_sum[g] / vanilla_count[g] if vanilla_count[g] else 0,
+            "skilled_avg": skilled_sum[g] / skilled_count[g] if skilled_count[g] else 0,
         })
+    return groups
 
-        # Update by_jury stats
-        jury_stats = stats["by_jury"][jury_name]
-        jury_stats["total"] += 1
-        if actual_winner == "vanilla":
-            jury_stats["vanilla_wins"] += 1
-        elif actual_winner == "skilled":
-            jury_stats["skilled_wins"] += 1
-        else:
-            jury_stats["ties"] += 1
 
-    # Calculate averages
-    if stats["overall"]["vanilla_avg_score"]:
-        stats["overall"]["vanilla_avg"] = sum(stats["overall"]["vanilla_avg_score"]) / len(stats["overall"]["vanilla_avg_score"])
-    else:
-        stats["overall"]["vanilla_avg"] = 0
+def calculate_statistics(jury_scores: List[dict]) -> dict:
+    """Calculate aggregate statistics from jury scores"""
 
-    if stats["overall"]["skilled_avg_score"]:
-        stats["overall"]["skilled_avg"] = sum(stats["overall"]["skilled_avg_score"]) / len(stats["overall"]["skilled_avg_score"])
-    else:
-        stats["overall"]["skilled_avg"] = 0
+    columns = build_score_columns(jury_scores)
+    winner = columns["winner"]
+    vanilla_score = columns["vanilla_score"]
+    skilled_score = columns["skilled_score"]
 
-    for skill_id, skill_stats in stats["by_skill"].items():
-        if skill_stats["vanilla_scores"]:
-            skill_stats["vanilla_avg"] = sum(skill_stats["vanilla_scores"]) / len(skill_stats["vanilla_scores"])
-        else:
-            skill_stats["vanilla_avg"] = 0
+    skill_codes, skill_ids = factorize(columns["skill"])
+    jury_codes, jury_names = factorize(columns["jury"])
 
-        if skill_stats["skilled_scores"]:
-            skill_stats["skilled_avg"] = sum(skill_stats["skilled_scores"]) / len(skill_stats["skilled_scores"])
-        else:
-            skill_stats["skilled_avg"] = 0
+    # Overall stats are a single group that every score belongs to
+    all_rows = array("i", [0]) * len(winner)
+    overall = aggregate(winner, all_rows, vanilla_score, skilled_score, 1)[0]
+    by_skill = aggregate(winner, skill_codes, vanilla_score, skilled_score, len(skill_ids))
+    by_jury = aggregate(winner, jury_codes, vanilla_score, skilled_score, len(jury_names))
+
+    stats = {
+        "overall": overall,
+        "by_skill": dict(zip(skill_ids, by_skill)),
+        "by_jury": dict(zip(jury_names, by_jury)),
+    }
+
+    # Per-test results keep the nested shape the markdown emitters expect
+    for skill_stats in by_skill:
+        skill_stats["tests"] = defaultdict(lambda: {"jury_results": []})
+    for i, code in enumerate(skill_codes):
+        by_skill[code]["tests"][columns["test"][i]]["jury_results"].append({
+            "jury": columns["jury"][i],
+            "winner": WINNER_NAMES[winner[i]],
+            "vanilla_score": vanilla_score[i],
+            "skilled_score": skilled_score[i],
+            "reasoning": columns["reasoning"][i],
+        })
 
     return stats
 
 
-def generate_report_markdown(run_id: str, metadata: dict, stats: dict) -> str:
-    """Generate the main benchmark report in markdown format"""
+# Unpacks a jury result row into locals for the table formatter
+RESULT_FIELDS = itemgetter("jury", "winner", "vanilla_score", "skilled_score", "reasoning")
+
+
+def truncate(text: str, limit: int) -> str:
+    """Clip text for a table cell, marking the cut with an ellipsis"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def iter_report_markdown(run_id: str, metadata: dict, stats: dict) -> Iterator[str]:
+    """Generate the main benchmark report in markdown format, chunk by chunk"""
 
     overall = stats["overall"]
     total = overall["total"]
 
     if total == 0:
-        return "# Benchmark Report\n\nNo results found."
+        yield "# Benchmark Report\n\nNo results found."
+        return
 
-    skilled_win_rate = (overall["skilled_wins"] / total) * 100 if total > 0 else 0
-    vanilla_win_rate = (overall["vanilla_wins"] / total) * 100 if total > 0 else 0
-    tie_rate = (overall["ties"] / total) * 100 if total > 0 else 0
+    # Bind the fields the templates use to locals once
+    skilled_wins = overall["skilled_wins"]
+    vanilla_wins = overall["vanilla_wins"]
+    ties = overall["ties"]
+    vanilla_avg = overall["vanilla_avg"]
+    skilled_avg = overall["skilled_avg"]
 
-    score_delta = overall["skilled_avg"] - overall["vanilla_avg"]
+    skilled_win_rate = (skilled_wins / total) * 100 if total > 0 else 0
+    vanilla_win_rate = (vanilla_wins / total) * 100 if total > 0 else 0
+    tie_rate = (ties / total) * 100 if total > 0 else 0
 
-    report = f"""# Skill Benchmark Report
+    score_delta = skilled_avg - vanilla_avg
+
+    yield f"""# Skill Benchmark Report
 
 **Run ID:** {run_id}
 **Date:** {metadata.get('timestamp', 'Unknown')}
@@ -216,15 +324,15 @@ def generate_report_markdown(run_id: str, metadata: dict, stats: dict) -> str:
 
 ```
                     Vanilla    Skilled    Delta
-Avg Benchmark:      {overall['vanilla_avg']:.1f}        {overall['skilled_avg']:.1f}       {score_delta:+.1f}
+Avg Benchmark:      {vanilla_avg:.1f}        {skilled_avg:.1f}       {score_delta:+.1f}
 Win Rate:           {vanilla_win_rate:.0f}%         {skilled_win_rate:.0f}%
 ```
 
 | Metric | Value |
 |--------|-------|
-| Skilled Wins | {overall['skilled_wins']} ({skilled_win_rate:.1f}%) |
-| Vanilla Wins | {overall['vanilla_wins']} ({vanilla_win_rate:.1f}%) |
-| Ties | {overall['ties']} ({tie_rate:.1f}%) |
+| Skilled Wins | {skilled_wins} ({skilled_win_rate:.1f}%) |
+| Vanilla Wins | {vanilla_wins} ({vanilla_win_rate:.1f}%) |
+| Ties | {ties} ({tie_rate:.1f}%) |
 | Total Evaluations | {total} |
 
 **Target: 70% skilled win rate** {'✅ PASS' if skilled_win_rate >= 70 else '❌ BELOW TARGET'}
@@ -238,13 +346,16 @@ Win Rate:           {vanilla_win_rate:.0f}%         {skilled_win_rate:.0f}%
     for jury_name, jury_stats in stats["by_jury"].items():
         j_total = jury_stats["total"]
         if j_total > 0:
-            j_skilled_rate = (jury_stats["skilled_wins"] / j_total) * 100
-            report += f"### {jury_name}\n"
-            report += f"- Skilled wins: {jury_stats['skilled_wins']}/{j_total} ({j_skilled_rate:.0f}%)\n"
-            report += f"- Vanilla wins: {jury_stats['vanilla_wins']}/{j_total}\n"
-            report += f"- Ties: {jury_stats['ties']}/{j_total}\n\n"
+            j_skilled_wins = jury_stats["skilled_wins"]
+            j_skilled_rate = (j_skilled_wins / j_total) * 100
+            yield (
+                f"### {jury_name}\n"
+                f"- Skilled wins: {j_skilled_wins}/{j_total} ({j_skilled_rate:.0f}%)\n"
+                f"- Vanilla wins: {jury_stats['vanilla_wins']}/{j_total}\n"
+                f"- Ties: {jury_stats['ties']}/{j_total}\n\n"
+            )
 
-    report += """---
+    yield """---
 
 ## Results by Skill
 
@@ -253,41 +364,46 @@ Win Rate:           {vanilla_win_rate:.0f}%         {skilled_win_rate:.0f}%
     for skill_id, skill_stats in stats["by_skill"].items():
         s_total = skill_stats["total"]
         if s_total > 0:
-            s_skilled_rate = (skill_stats["skilled_wins"] / s_total) * 100
-            s_delta = skill_stats["skilled_avg"] - skill_stats["vanilla_avg"]
+            s_skilled_wins = skill_stats["skilled_wins"]
+            s_vanilla_avg = skill_stats["vanilla_avg"]
+            s_skilled_avg = skill_stats["skilled_avg"]
+            s_skilled_rate = (s_skilled_wins / s_total) * 100
+            s_delta = s_skilled_avg - s_vanilla_avg
 
             status = "✅" if s_skilled_rate >= 70 else "⚠️"
 
-            report += f"""### {skill_id} {status}
+            yield f"""### {skill_id} {status}
 
 | Metric | Vanilla | Skilled | Delta |
 |--------|---------|---------|-------|
-| Avg Score | {skill_stats['vanilla_avg']:.1f} | {skill_stats['skilled_avg']:.1f} | {s_delta:+.1f} |
-| Wins | {skill_stats['vanilla_wins']} | {skill_stats['skilled_wins']} | - |
+| Avg Score | {s_vanilla_avg:.1f} | {s_skilled_avg:.1f} | {s_delta:+.1f} |
+| Wins | {skill_stats['vanilla_wins']} | {s_skilled_wins} | - |
 
 """
 
-    report += """---
+    yield """---
 
 ## Detailed Test Results
 
 """
 
     for skill_id, skill_stats in stats["by_skill"].items():
-        report += f"### {skill_id}\n\n"
+        yield f"### {skill_id}\n\n"
 
         for test_id, test_data in skill_stats["tests"].items():
-            report += f"#### {test_id}\n\n"
-            report += "| Jury | Winner | Vanilla | Skilled | Reasoning |\n"
-            report += "|------|--------|---------|---------|----------|\n"
-
-            for result in test_data["jury_results"]:
-                reasoning = result["reasoning"][:80] + "..." if len(result.get("reasoning", "")) > 80 else result.get("reasoning", "")
-                report += f"| {result['jury']} | {result['winner']} | {result['vanilla_score']} | {result['skilled_score']} | {reasoning} |\n"
-
-            report += "\n"
-
-    report += f"""---
+            yield f"#### {test_id}\n\n"
+            rows = [
+                f"| {jury} | {winner} | {vanilla_score} | {skilled_score} | {truncate(reasoning, 80)} |"
+                for jury, winner, vanilla_score, skilled_score, reasoning
+                in map(RESULT_FIELDS, test_data["jury_results"])
+            ]
+            yield "\n".join([
+                "| Jury | Winner | Vanilla | Skilled | Reasoning |",
+                "|------|--------|---------|---------|----------|",
+                *rows,
+            ]) + "\n\n"
+
+    yield f"""---
 
 ## Improvement Recommendations
 
@@ -302,33 +418,37 @@ Based on these results, focus on:
 *Generated: {datetime.now().isoformat()}*
 """
 
-    return report
-
 
-def generate_improvement_areas(skill_id: str, skill_stats: dict, run_id: str) -> str:
-    """Generate improvement-areas.md for a specific skill"""
+def iter_improvement_areas(skill_id: str, skill_stats: dict, run_id: str) -> Iterator[str]:
+    """Generate improvement-areas.md for a specific skill, chunk by chunk"""
 
     s_total = skill_stats["total"]
     if s_total == 0:
-        return ""
+        return
 
+    s_vanilla_avg = skill_stats["vanilla_avg"]
+    s_skilled_avg = skill_stats["skilled_avg"]
     s_skilled_rate = (skill_stats["skilled_wins"] / s_total) * 100
-    s_delta = skill_stats["skilled_avg"] - skill_stats["vanilla_avg"]
+    s_delta = s_skilled_avg - s_vanilla_avg
 
     # Collect wins and losses
     wins = []
     losses = []
 
     for test_id, test_data in skill_stats["tests"].items():
-        skilled_votes = sum(1 for r in test_data["jury_results"] if r["winner"] == "skilled")
-        vanilla_votes = sum(1 for r in test_data["jury_results"] if r["winner"] == "vanilla")
+        # Partition the jury results by winner in one sweep
+        by_winner = defaultdict(list)
+        for r in test_data["jury_results"]:
+            by_winner[r["winner"]].append(r)
+        skilled_results = by_winner["skilled"]
+        vanilla_results = by_winner["vanilla"]
 
-        if skilled_votes > vanilla_votes:
-            wins.append((test_id, test_data, skilled_votes, vanilla_votes))
-        elif vanilla_votes > skilled_votes:
-            losses.append((test_id, test_data, skilled_votes, vanilla_votes))
+        if len(skilled_results) > len(vanilla_results):
+            wins.append((test_id, skilled_results, vanilla_results))
+        elif len(vanilla_results) > len(skilled_results):
+            losses.append((test_id, skilled_results, vanilla_results))
 
-    content = f"""# {skill_id.replace('-', ' ').title()} Skill - Improvement Areas
+    yield f"""# {skill_id.replace('-', ' ').title()} Skill - Improvement Areas
 
 > Generated from benchmark run {run_id}
 
@@ -337,35 +457,33 @@ def generate_improvement_areas(skill_id: str, skill_stats: dict, run_id: str) ->
 | Metric | Value |
 |--------|-------|
 | Win Rate | {s_skilled_rate:.1f}% {'✅' if s_skilled_rate >= 70 else '⚠️ BELOW TARGET'} |
-| Avg Score Delta | {s_delta:+.1f} (Skilled: {skill_stats['skilled_avg']:.1f}, Vanilla: {skill_stats['vanilla_avg']:.1f}) |
+| Avg Score Delta | {s_delta:+.1f} (Skilled: {s_skilled_avg:.1f}, Vanilla: {s_vanilla_avg:.1f}) |
 | Tests Evaluated | {s_total} |
 
 """
 
     if losses:
-        content += "## Tests Where Skill Lost\n\n"
-        for test_id, test_data, skilled_votes, vanilla_votes in losses:
-            content += f"### {test_id}\n"
-            content += f"- **Jury vote:** Vanilla {vanilla_votes} - Skilled {skilled_votes}\n"
-            content += "- **Jury reasoning:**\n"
-            for r in test_data["jury_results"]:
-                if r["winner"] == "vanilla":
-                    content += f"  - {r['jury']}: {r.get('reasoning', 'No reasoning provided')}\n"
-            content += "- **Root cause:** [TODO: Analyze]\n"
-            content += "- **Action:** [TODO: Define fix]\n"
-            content += "- **Status:** [ ] Not started\n\n"
+        yield "## Tests Where Skill Lost\n\n"
+        for test_id, skilled_results, vanilla_results in losses:
+            yield f"### {test_id}\n"
+            yield f"- **Jury vote:** Vanilla {len(vanilla_results)} - Skilled {len(skilled_results)}\n"
+            yield "- **Jury reasoning:**\n"
+            for r in vanilla_results:
+                yield f"  - {r['jury']}: {r.get('reasoning', 'No reasoning provided')}\n"
+            yield "- **Root cause:** [TODO: Analyze]\n"
+            yield "- **Action:** [TODO: Define fix]\n"
+            yield "- **Status:** [ ] Not started\n\n"
 
     if wins:
-        content += "## Tests Where Skill Won (Reinforce)\n\n"
-        for test_id, test_data, skilled_votes, vanilla_votes in wins:
-            content += f"### {test_id}\n"
-            content += f"- **Jury vote:** Skilled {skilled_votes} - Vanilla {vanilla_votes}\n"
-            for r in test_data["jury_results"]:
-                if r["winner"] == "skilled":
-                    content += f"- **Why it won ({r['jury']}):** {r.get('reasoning', 'No reasoning provided')}\n"
-            content += "\n"
+        yield "## Tests Where Skill Won (Reinforce)\n\n"
+        for test_id, skilled_results, vanilla_results in wins:
+            yield f"### {test_id}\n"
+            yield f"- **Jury vote:** Skilled {len(skilled_results)} - Vanilla {len(vanilla_results)}\n"
+            for r in skilled_results:
+                yield f"- **Why it won ({r['jury']}):** {r.get('reasoning', 'No reasoning provided')}\n"
+            yield "\n"
 
-    content += f"""## Improvement Backlog
+    yield f"""## Improvement Backlog
 
 - [ ] Review tests where skill lost
 - [ ] Analyze jury reasoning for patterns
@@ -378,34 +496,42 @@ def generate_improvement_areas(skill_id: str, skill_stats: dict, run_id: str) ->
 *Last updated: {datetime.now().strftime('%Y-%m-%d')}*
 """
 
-    return content
-
 
-def save_report(run_id: str, report: str):
-    """Save the main report"""
+def save_report(run_id: str, report: Iterator[str]):
+    """Stream the main report to disk"""
     output_path = Path(__file__).parent.parent / "outputs" / run_id / "report.md"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(report)
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(report)
     print(f"Report saved: {output_path}")
 
 
-def save_improvement_areas(skill_id: str, content: str):
-    """Save improvement-areas.md to skill folder"""
-    # Find the skill folder
+def build_skill_index() -> Dict[str, Path]:
+    """Map skill id -> skill folder across all category directories"""
     skills_base = Path(__file__).parent.parent.parent / "spawner-v2" / "skills"
+    if not skills_base.exists():
+        return {}
 
-    # Search for the skill folder
+    skill_index = {}
     for category in skills_base.iterdir():
         if category.is_dir():
-            skill_folder = category / skill_id
-            if skill_folder.exists():
-                output_path = skill_folder / "improvement-areas.md"
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                print(f"Improvement areas saved: {output_path}")
-                return
+            for skill_folder in category.iterdir():
+                # First category wins if a skill id appears twice
+                if skill_folder.is_dir():
+                    skill_index.setdefault(skill_folder.name, skill_folder)
+
+    return skill_index
+
+
+def save_improvement_areas(skill_id: str, content: Iterator[str], skill_index: Dict[str, Path]) -> Optional[Path]:
+    """Stream improvement-areas.md to the skill folder, returning its path"""
+    skill_folder = skill_index.get(skill_id)
+    if skill_folder is None:
+        return None
 
-    print(f"Warning: Could not find skill folder for {skill_id}")
+    output_path = skill_folder / "improvement-areas.md"
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(content)
+    return output_path
 
 
 def main():
@@ -431,16 +557,25 @@ def main():
     stats = calculate_statistics(jury_scores)
 
     # Generate main report
-    report = generate_report_markdown(args.run_id, metadata, stats)
-    save_report(args.run_id, report)
+    save_report(args.run_id, iter_report_markdown(args.run_id, metadata, stats))
 
     # Generate per-skill improvement files
     if not args.no_improvement_files:
         print("\nGenerating skill improvement files...")
-        for skill_id, skill_stats in stats["by_skill"].items():
-            content = generate_improvement_areas(skill_id, skill_stats, args.run_id)
-            if content:
-                save_improvement_areas(skill_id, content)
+        skill_index = build_skill_index()
+        skills = [skill_id for skill_id, skill_stats in stats["by_skill"].items() if skill_stats["total"]]
+
+        def write_skill_file(skill_id: str) -> Optional[Path]:
+            content = iter_improvement_areas(skill_id, stats["by_skill"][skill_id], args.run_id)
+            return save_improvement_areas(skill_id, content, skill_index)
+
+        # Each skill's file is independent, so build and write them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for skill_id, output_path in zip(skills, executor.map(write_skill_file, skills)):
+                if output_path:
+                    print(f"Improvement areas saved: {output_path}")
+                else:
+                    print(f"Warning: Could not find skill folder for {skill_id}")
 
     print(f"\n{'='*60}")
     print(f"Report generation complete!")
@@ -12,14 +12,18 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
+import functools
 import os
 import sys
+import tempfile
 import yaml
 import json
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,6 +34,44 @@ except ImportError:
     print("Error: anthropic package not installed. Run: pip install anthropic")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader; fall back to pure Python if not built
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Process umask, read once so atomic writes can apply it to their temp files
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Encode JSON to bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file in the same directory, then rename into place"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file owner-only; give it the mode a plain
+        # open() would have so readers of the outputs aren't locked out
+        os.chmod(tmp_name, 0o666 & ~UMASK)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
 
 def load_config() -> dict:
     """Load configuration from config.yaml or config.local.yaml"""
@@ -40,7 +82,7 @@ def load_config() -> dict:
         config_path = local_config_path
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     # Substitute environment variables
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
@@ -52,6 +94,7 @@ def load_config() -> dict:
     return config
 
 
+@functools.lru_cache(maxsize=None)
 def load_test_cases(skill_id: str) -> dict:
     """Load test cases for a specific skill"""
     test_path = Path(__file__).parent.parent / "test-cases" / f"{skill_id}.yaml"
@@ -61,9 +104,10 @@ def load_test_cases(skill_id: str) -> dict:
         return None
 
     with open(test_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
+@functools.lru_cache(maxsize=128)
 def load_skill(skill_path: str) -> str:
     """Load skill content from YAML files"""
     base_path = Path(__file__).parent.parent.parent / "spawner-v2" / "skills" / skill_path
@@ -74,7 +118,7 @@ def load_skill(skill_path: str) -> str:
     skill_yaml = base_path / "skill.yaml"
     if skill_yaml.exists():
         with open(skill_yaml) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
             if data.get("identity"):
                 skill_content.append(f"# Identity\n{data['identity']}")
             if data.get("patterns"):
@@ -88,7 +132,7 @@ def load_skill(skill_path: str) -> str:
     sharp_edges_yaml = base_path / "sharp-edges.yaml"
     if sharp_edges_yaml.exists():
         with open(sharp_edges_yaml) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
             if data and data.get("sharp_edges"):
                 skill_content.append("\n# Sharp Edges (Common Mistakes)")
                 for edge in data["sharp_edges"]:
@@ -104,35 +148,171 @@ def load_skill(skill_path: str) -> str:
     return "\n\n".join(skill_content) if skill_content else ""
 
 
-def run_contestant(
-    client: anthropic.Anthropic,
-    prompt: str,
-    skill_content: Optional[str],
-    config: dict
-) -> str:
-    """Run a single contestant (vanilla or skilled) on a prompt"""
+def get_cache_path(key: str) -> Path:
+    """Location of a cached response, sharded by hash prefix"""
+    return Path(__file__).parent.parent / "outputs" / "_cache" / key[:2] / f"{key}.json"
+
+
+def load_cached_response(key: str) -> Optional[str]:
+    """Return a cached response, or None on a miss"""
+    cache_path = get_cache_path(key)
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)["response"]
+    except (json.JSONDecodeError, KeyError):
+        return None
 
-    system_prompt = ""
-    if skill_content:
-        system_prompt = f"""You are an expert with deep domain knowledge. Apply the following expertise when responding:
+
+def save_cached_response(key: str, entry: dict):
+    """Write a cache entry atomically so an interrupted run can't corrupt it"""
+    cache_path = get_cache_path(key)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(cache_path, dump_json(entry))
+
+
+def build_system_prompt(skill_content: Optional[str]) -> str:
+    """Wrap skill content in the skilled contestant's system prompt"""
+    if not skill_content:
+        return ""
+
+    return f"""You are an expert with deep domain knowledge. Apply the following expertise when responding:
 
 {skill_content}
 
 Use this knowledge to provide expert-level responses, catching common mistakes and applying best practices."""
 
+
+# Requests already issued this run, keyed like the response cache
+RESPONSES: Dict[str, "asyncio.Future[str]"] = {}
+
+
+async def run_contestant(
+    client: anthropic.AsyncAnthropic,
+    semaphore: asyncio.Semaphore,
+    prompt: str,
+    system_prompt: str,
+    config: dict,
+    use_cache: bool = True,
+    replay_only: bool = False
+) -> str:
+    """Run a single contestant (vanilla or skilled) on a prompt"""
+
     temperature = config["settings"].get("contestant_temperature", 0.3)
+    model = config["contestants"]["vanilla"]["model"]
+    key = hashlib.sha256(f"{model}|{temperature}|{system_prompt}|{prompt}".encode()).hexdigest()
+
+    # Identical requests in one run (e.g. a vanilla prompt shared by several
+    # skills) share a single call, even while it is still in flight
+    if key not in RESPONSES:
+        RESPONSES[key] = asyncio.ensure_future(request_response(
+            client, semaphore, key, model, temperature, prompt, system_prompt,
+            config, use_cache, replay_only
+        ))
+    return await RESPONSES[key]
+
+
+async def request_response(
+    client: anthropic.AsyncAnthropic,
+    semaphore: asyncio.Semaphore,
+    key: str,
+    model: str,
+    temperature: float,
+    prompt: str,
+    system_prompt: str,
+    config: dict,
+    use_cache: bool,
+    replay_only: bool
+) -> str:
+    """Fetch a response from the disk cache or the API"""
+
+    max_retries = config["settings"].get("max_retries", 3)
+    retry_delay = config["settings"].get("retry_delay_seconds", 5)
+
+    # Identical inputs produce a cache hit instead of a paid API call
+    if use_cache or replay_only:
+        cached = await asyncio.to_thread(load_cached_response, key)
+        if cached is not None:
+            return cached
+        if replay_only:
+            raise LookupError(f"No cached response for prompt {key[:12]} (--replay-only)")
+
+    # The skill prompt is identical across a skill's tests, so mark it for
+    # server-side prompt caching; main() sends one skilled call per skill
+    # ahead of the rest so the others read the prefix it wrote
+    if system_prompt:
+        system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+    else:
+        system = anthropic.NOT_GIVEN
+
+    async with semaphore:
+        for attempt in range(max_retries + 1):
+            try:
+                response = await client.messages.create(
+                    model=model,
+                    max_tokens=4096,
+                    temperature=temperature,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                text = response.content[0].text
+                break
+            except anthropic.RateLimitError as e:
+                if attempt == max_retries:
+                    return f"ERROR: {str(e)}"
+                # Exponential backoff: 5s, 10s, 20s, ...
+                await asyncio.sleep(retry_delay * 2 ** attempt)
+            except Exception as e:
+                return f"ERROR: {str(e)}"
+
+    if use_cache:
+        await asyncio.to_thread(save_cached_response, key, {
+            "prompt": prompt,
+            "system": system_prompt,
+            "model": model,
+            "temperature": temperature,
+            "response": text,
+            "ts": datetime.now().isoformat(),
+        })
+
+    return text
+
+
+async def run_and_save(
+    client: anthropic.AsyncAnthropic,
+    semaphore: asyncio.Semaphore,
+    run_id: str,
+    skill_id: str,
+    test_id: str,
+    contestant: str,
+    prompt: str,
+    system_prompt: str,
+    config: dict,
+    use_cache: bool = True,
+    replay_only: bool = False
+):
+    """Run one contestant and persist its output"""
+    output = await run_contestant(
+        client, semaphore, prompt, system_prompt, config, use_cache, replay_only
+    )
+    output_file = await asyncio.to_thread(save_output, run_id, skill_id, test_id, contestant, output)
+    # Printed from the event loop so lines from concurrent saves don't interleave
+    print(f"  Saved: {output_file.name}")
+
 
+async def run_prefix_warmer_first(runs: list):
+    """Await the first run alone, then the rest concurrently"""
+    # A cached prompt prefix is only readable once a request has written it;
+    # sending a skill's calls all at once would pay the cache write on each
     try:
-        response = client.messages.create(
-            model=config["contestants"]["vanilla"]["model"],
-            max_tokens=4096,
-            temperature=temperature,
-            system=system_prompt if system_prompt else None,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
-    except Exception as e:
-        return f"ERROR: {str(e)}"
+        await runs[0]
+    except BaseException:
+        for run in runs[1:]:
+            run.close()
+        raise
+    await asyncio.gather(*runs[1:])
 
 
 def generate_run_id() -> str:
@@ -140,16 +320,14 @@ def generate_run_id() -> str:
     return datetime.now().strftime("%Y-%m-%d-%H%M%S")
 
 
-def save_output(run_id: str, skill_id: str, test_id: str, contestant: str, output: str):
+def save_output(run_id: str, skill_id: str, test_id: str, contestant: str, output: str) -> Path:
     """Save contestant output to file"""
     output_dir = Path(__file__).parent.parent / "outputs" / run_id / "contestants"
     output_dir.mkdir(parents=True, exist_ok=True)
 
     output_file = output_dir / f"{skill_id}_{test_id}_{contestant}.md"
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(output)
-
-    print(f"  Saved: {output_file.name}")
+    write_atomic(output_file, output.encode("utf-8"))
+    return output_file
 
 
 def save_metadata(run_id: str, test_cases: list, skills_tested: list):
@@ -165,19 +343,23 @@ def save_metadata(run_id: str, test_cases: list, skills_tested: list):
         "status": "contestants_complete"
     }
 
-    with open(output_dir / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    write_atomic(output_dir / "metadata.json", dump_json(metadata, indent=True))
 
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="Run benchmark contestants")
     parser.add_argument("--skills", required=True, help="Comma-separated skill IDs or 'all'")
     parser.add_argument("--test-id", help="Run specific test ID only")
     parser.add_argument("--run-id", help="Use specific run ID (default: auto-generated)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the API, bypassing the response cache")
+    parser.add_argument("--replay-only", action="store_true",
+                        help="Serve every call from the response cache; fail on a miss")
     args = parser.parse_args()
 
     config = load_config()
-    client = anthropic.Anthropic(api_key=config["api_keys"]["anthropic"])
+    client = anthropic.AsyncAnthropic(api_key=config["api_keys"]["anthropic"])
+    semaphore = asyncio.Semaphore(config["settings"].get("max_concurrency", 16))
 
     # Determine which skills to test
     if args.skills == "all":
@@ -193,16 +375,27 @@ def main():
     print(f"{'='*60}\n")
 
     all_test_cases = []
+    tasks = []
 
     for skill_id in skills_to_test:
-        print(f"\n--- Skill: {skill_id} ---")
-
         # Load test cases
         test_data = load_test_cases(skill_id)
         if not test_data:
+            print(f"\n--- Skill: {skill_id} ---")
             print(f"  Skipping {skill_id} - no test cases found")
             continue
 
+        # Select tests up front so a --test-id run skips other skills
+        # before loading their skill content
+        tests_to_run = [
+            test for test in test_data.get("tests", [])
+            if not args.test_id or test["id"] == args.test_id
+        ]
+        if not tests_to_run:
+            continue
+
+        print(f"\n--- Skill: {skill_id} ---")
+
         # Load skill content
         skill_path = test_data.get("skill_path", skill_id)
         skill_content = load_skill(skill_path)
@@ -212,27 +405,28 @@ def main():
         else:
             print(f"  Loaded skill content ({len(skill_content)} chars)")
 
+        # Built once per skill and shared by every skilled run
+        system_prompt = build_system_prompt(skill_content)
+        skilled_runs = []
+
         # Run each test
-        for test in test_data.get("tests", []):
+        for test in tests_to_run:
             test_id = test["id"]
-
-            # Skip if filtering by test ID
-            if args.test_id and test_id != args.test_id:
-                continue
-
             print(f"\n  Test: {test_id} ({test['type']})")
 
             prompt = test["prompt"]
 
-            # Run vanilla (no skill)
-            print("    Running vanilla...")
-            vanilla_output = run_contestant(client, prompt, None, config)
-            save_output(run_id, skill_id, test_id, "vanilla", vanilla_output)
-
-            # Run skilled (with skill)
-            print("    Running skilled...")
-            skilled_output = run_contestant(client, prompt, skill_content, config)
-            save_output(run_id, skill_id, test_id, "skilled", skilled_output)
+            # Queue vanilla (no skill) and skilled (with skill) runs
+            tasks.append(run_and_save(
+                client, semaphore, run_id, skill_id, test_id,
+                "vanilla", prompt, "", config,
+                use_cache=not args.no_cache, replay_only=args.replay_only
+            ))
+            skilled_runs.append(run_and_save(
+                client, semaphore, run_id, skill_id, test_id,
+                "skilled", prompt, system_prompt, config,
+                use_cache=not args.no_cache, replay_only=args.replay_only
+            ))
 
             all_test_cases.append({
                 "skill_id": skill_id,
@@ -242,6 +436,18 @@ def main():
                 "prompt": prompt
             })
 
+        # The first skilled call writes the skill prefix to the prompt cache,
+        # and the skill's remaining skilled calls are released once it lands
+        tasks.append(run_prefix_warmer_first(skilled_runs))
+
+    # Run all contestants concurrently, bounded by max_concurrency
+    print(f"\nRunning {2 * len(all_test_cases)} contestant calls...")
+    try:
+        await asyncio.gather(*tasks)
+    except LookupError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
     # Save metadata
     save_metadata(run_id, all_test_cases, skills_to_test)
 
@@ -255,4 +461,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -11,16 +11,34 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
 import os
 import sys
+import tempfile
 import yaml
 import json
 import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Prefer the libyaml-backed loader; fall back to pure Python if not built
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUTS = ROOT / "outputs"
+
+sys.path.insert(0, str(ROOT))
 
 # Import API clients
 try:
@@ -33,50 +51,71 @@ try:
 except ImportError:
     openai = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import google.generativeai as genai
+    from google.api_core.exceptions import ResourceExhausted
 except ImportError:
     genai = None
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
 
-JURY_PROMPT_TEMPLATE = """You are evaluating two responses to the same task.
-Do not assume which is better - evaluate purely on merit.
-
-TASK:
-{task_prompt}
+# Process umask, read once so atomic writes can apply it to their temp files
+UMASK = os.umask(0)
+os.umask(UMASK)
 
----
+# Shared API clients, one per provider, created in init_clients()
+CLIENTS = {}
 
-RESPONSE A:
-{response_a}
+# Per-provider caps on in-flight jury calls, created in main()
+SEMAPHORES = {}
 
----
+# Jury model name -> provider model id it calls
+JURY_MODEL_IDS = {
+    "claude-opus": "claude-sonnet-4-20250514",
+    "gpt-4o": "gpt-4o",
+    "gemini-pro": "gemini-1.5-pro",
+    "llama-3.1": "meta-llama/Llama-3.1-70B-Instruct-Turbo",
+}
 
-RESPONSE B:
-{response_b}
 
----
+# Static instructions, sent ahead of the per-call prompt (as the system
+# prompt) so providers can cache them as a stable prefix
+JURY_INSTRUCTIONS = """You are evaluating two responses to the same task.
+Do not assume which is better - evaluate purely on merit.
 
 Evaluate each response and provide your assessment in the following JSON format:
 
-{{
-  "response_a": {{
+{
+  "response_a": {
     "correctness": <1-10>,
     "completeness": <1-10>,
     "expertise": <1-10>,
     "gotcha_awareness": <1-10>,
     "benchmark_score": <0-100>
-  }},
-  "response_b": {{
+  },
+  "response_b": {
     "correctness": <1-10>,
     "completeness": <1-10>,
     "expertise": <1-10>,
     "gotcha_awareness": <1-10>,
     "benchmark_score": <0-100>
-  }},
+  },
   "winner": "<A|B|Tie>",
   "reasoning": "<2-3 sentence explanation of your decision>"
-}}
+}
 
 Scoring guide:
 - CORRECTNESS: Is the information/code accurate?
@@ -87,17 +126,71 @@ Scoring guide:
 
 Respond ONLY with valid JSON, no other text."""
 
+JURY_PROMPT_TEMPLATE = """TASK:
+{task_prompt}
+
+---
+
+RESPONSE A:
+{response_a}
+
+---
+
+RESPONSE B:
+{response_b}
+
+---
+
+Evaluate both responses as instructed. Respond ONLY with valid JSON, no other text."""
+
+# Split the template into its literal chunks once at import, so building a
+# prompt is a single join instead of a format() pass over the whole template
+PROMPT_PRE_TASK, PROMPT_PRE_A, PROMPT_PRE_B, PROMPT_POST = re.split(
+    r"\{task_prompt\}|\{response_a\}|\{response_b\}", JURY_PROMPT_TEMPLATE
+)
+
+
+def parse_json(data) -> dict:
+    """Decode JSON text or bytes, using orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Encode JSON to bytes, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write via a temp file in the same directory, then rename into place"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file owner-only; give it the mode a plain
+        # open() would have so readers of the outputs aren't locked out
+        os.chmod(tmp_name, 0o666 & ~UMASK)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
     """Load configuration from config.yaml or config.local.yaml"""
-    config_path = Path(__file__).parent.parent / "config.yaml"
-    local_config_path = Path(__file__).parent.parent / "config.local.yaml"
+    config_path = ROOT / "config.yaml"
+    local_config_path = ROOT / "config.local.yaml"
 
     if local_config_path.exists():
         config_path = local_config_path
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        config = yaml.load(f, Loader=SafeLoader)
 
     # Load API keys from environment
     config["api_keys"] = {
@@ -110,145 +203,347 @@ def load_config() -> dict:
     return config
 
 
+def init_clients(config: dict):
+    """Create one reusable API client per configured provider"""
+    api_keys = config["api_keys"]
+
+    # Reusing a client keeps its connection pool warm across jury calls
+    if anthropic and api_keys.get("anthropic"):
+        CLIENTS["anthropic"] = anthropic.AsyncAnthropic(api_key=api_keys["anthropic"])
+    if openai and api_keys.get("openai"):
+        CLIENTS["openai"] = openai.AsyncOpenAI(api_key=api_keys["openai"])
+    if httpx and api_keys.get("together"):
+        CLIENTS["together"] = httpx.AsyncClient(
+            base_url="https://api.together.xyz/v1",
+            headers={
+                "Authorization": f"Bearer {api_keys['together']}",
+                "Content-Type": "application/json"
+            },
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_connections=64)
+        )
+    if genai and api_keys.get("google"):
+        # configure() sets process-wide state, so do it once rather than per call
+        genai.configure(api_key=api_keys["google"])
+        CLIENTS["google"] = genai.GenerativeModel(JURY_MODEL_IDS["gemini-pro"], system_instruction=JURY_INSTRUCTIONS)
+
+
+@functools.lru_cache(maxsize=1)
 def load_run_metadata(run_id: str) -> dict:
     """Load metadata from a previous contestant run"""
-    metadata_path = Path(__file__).parent.parent / "outputs" / run_id / "metadata.json"
+    metadata_path = OUTPUTS / run_id / "metadata.json"
 
     if not metadata_path.exists():
         print(f"Error: Run metadata not found at {metadata_path}")
         print("Make sure you ran run-contestants.py first.")
         sys.exit(1)
 
-    with open(metadata_path) as f:
-        return json.load(f)
+    return parse_json(metadata_path.read_bytes())
 
 
-def load_contestant_output(run_id: str, skill_id: str, test_id: str, contestant: str) -> str:
-    """Load saved contestant output"""
-    output_path = (
-        Path(__file__).parent.parent
-        / "outputs"
-        / run_id
-        / "contestants"
-        / f"{skill_id}_{test_id}_{contestant}.md"
-    )
+def load_contestant_outputs(run_id: str) -> dict:
+    """Read every saved contestant output for a run, keyed by file name"""
+    contestants_dir = OUTPUTS / run_id / "contestants"
+    if not contestants_dir.exists():
+        return {}
+
+    with os.scandir(contestants_dir) as it:
+        paths = [Path(e.path) for e in it if e.is_file() and e.name.endswith(".md")]
 
-    if not output_path.exists():
-        return f"ERROR: Output not found at {output_path}"
+    # Reads are syscall-bound, so overlap them across threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        texts = executor.map(lambda path: path.read_text(encoding="utf-8"), paths)
+        return {path.name: text for path, text in zip(paths, texts)}
 
-    with open(output_path, encoding="utf-8") as f:
-        return f.read()
 
+def get_contestant_output(outputs: dict, run_id: str, skill_id: str, test_id: str, contestant: str) -> str:
+    """Look up a pre-loaded contestant output"""
+    file_name = f"{skill_id}_{test_id}_{contestant}.md"
+    if file_name not in outputs:
+        return f"ERROR: Output not found at {OUTPUTS / run_id / 'contestants' / file_name}"
+    return outputs[file_name]
 
-def call_anthropic(prompt: str, config: dict) -> str:
+
+async def with_retries(request, config: dict, retry_on: tuple):
+    """Await request(), backing off exponentially with jitter on transient errors"""
+    max_retries = config["settings"].get("max_retries", 3)
+    retry_delay = config["settings"].get("retry_delay_seconds", 5)
+
+    for attempt in range(max_retries + 1):
+        try:
+            return await request()
+        except retry_on:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(random.uniform(1, min(60, retry_delay * 2 ** attempt)))
+
+
+async def call_anthropic(prompt: str, config: dict) -> str:
     """Call Anthropic API"""
     if not anthropic:
         return '{"error": "anthropic package not installed"}'
 
-    client = anthropic.Anthropic(api_key=config["api_keys"]["anthropic"])
+    client = CLIENTS["anthropic"]
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
+    async def read_stream() -> str:
+        buf = io.StringIO()
+        async with client.messages.stream(
+            model=JURY_MODEL_IDS["claude-opus"],
             max_tokens=1024,
             temperature=config["settings"].get("jury_temperature", 0.1),
+            system=[{
+                "type": "text",
+                "text": JURY_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            }],
             messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+        ) as stream:
+            async for text in stream.text_stream:
+                buf.write(text)
+        return buf.getvalue()
+
+    async with SEMAPHORES["anthropic"]:
+        try:
+            return await with_retries(
+                read_stream,
+                config,
+                (anthropic.RateLimitError, anthropic.APIConnectionError)
+            )
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
+
+async def read_chat_stream(client, model: str, prompt: str, config: dict) -> str:
+    """Stream an OpenAI-compatible chat completion into a single string"""
+    buf = io.StringIO()
+    stream = await client.chat.completions.create(
+        model=model,
+        max_tokens=1024,
+        temperature=config["settings"].get("jury_temperature", 0.1),
+        messages=[
+            {"role": "system", "content": JURY_INSTRUCTIONS},
+            {"role": "user", "content": prompt}
+        ],
+        stream=True
+    )
+    async for chunk in stream:
+        # Some providers send usage or keep-alive chunks with no choices
+        if chunk.choices and chunk.choices[0].delta.content:
+            buf.write(chunk.choices[0].delta.content)
+    return buf.getvalue()
 
 
-def call_openai(prompt: str, config: dict) -> str:
+async def call_openai(prompt: str, config: dict) -> str:
     """Call OpenAI API"""
     if not openai:
         return '{"error": "openai package not installed"}'
 
-    client = openai.OpenAI(api_key=config["api_keys"]["openai"])
+    client = CLIENTS["openai"]
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            max_tokens=1024,
-            temperature=config["settings"].get("jury_temperature", 0.1),
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+    async with SEMAPHORES["openai"]:
+        try:
+            return await with_retries(
+                lambda: read_chat_stream(client, JURY_MODEL_IDS["gpt-4o"], prompt, config),
+                config,
+                (openai.RateLimitError, openai.APIConnectionError)
+            )
+        except Exception as e:
+            return json.dumps({"error": str(e)})
 
 
-def call_google(prompt: str, config: dict) -> str:
+async def call_google(prompt: str, config: dict) -> str:
     """Call Google Gemini API"""
     if not genai:
         return '{"error": "google-generativeai package not installed"}'
 
-    try:
-        genai.configure(api_key=config["api_keys"]["google"])
-        model = genai.GenerativeModel("gemini-1.5-pro")
-        response = model.generate_content(prompt)
-        return response.text
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+    model = CLIENTS["google"]
 
+    async def read_stream() -> str:
+        buf = io.StringIO()
+        response = await model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            buf.write(chunk.text)
+        return buf.getvalue()
 
-def call_together(prompt: str, config: dict) -> str:
-    """Call Together API (for Llama)"""
-    # Together uses OpenAI-compatible API
-    if not openai:
-        return '{"error": "openai package not installed (needed for Together)"}'
+    async with SEMAPHORES["google"]:
+        try:
+            return await with_retries(read_stream, config, (ResourceExhausted,))
+        except Exception as e:
+            return json.dumps({"error": str(e)})
 
-    client = openai.OpenAI(
-        api_key=config["api_keys"]["together"],
-        base_url="https://api.together.xyz/v1"
-    )
 
-    try:
-        response = client.chat.completions.create(
-            model="meta-llama/Llama-3.1-70B-Instruct-Turbo",
-            max_tokens=1024,
-            temperature=config["settings"].get("jury_temperature", 0.1),
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+class TogetherRateLimitError(Exception):
+    """Together returned HTTP 429"""
 
 
-JURY_CALLERS = {
-    "claude-opus": call_anthropic,
-    "gpt-4o": call_openai,
-    "gemini-pro": call_google,
-    "llama-3.1": call_together,
+async def call_together(prompt: str, config: dict) -> str:
+    """Call Together API (for Llama)"""
+    # Together's endpoint is OpenAI-compatible; calling it over plain httpx
+    # skips the SDK's request/response model validation
+    if not httpx:
+        return '{"error": "httpx package not installed (needed for Together)"}'
+
+    client = CLIENTS["together"]
+    body = dump_json({
+        "model": JURY_MODEL_IDS["llama-3.1"],
+        "max_tokens": 1024,
+        "temperature": config["settings"].get("jury_temperature", 0.1),
+        "messages": [
+            {"role": "system", "content": JURY_INSTRUCTIONS},
+            {"role": "user", "content": prompt}
+        ]
+    })
+
+    async def post() -> str:
+        response = await client.post("/chat/completions", content=body)
+        if response.status_code == 429:
+            raise TogetherRateLimitError(response.text)
+        response.raise_for_status()
+        return parse_json(response.content)["choices"][0]["message"]["content"]
+
+    async with SEMAPHORES["together"]:
+        try:
+            return await with_retries(post, config, (TogetherRateLimitError, httpx.TransportError))
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
+
+# Jury model name -> (provider whose API key it needs, caller)
+JURY_REGISTRY = {
+    "claude-opus": ("anthropic", call_anthropic),
+    "gpt-4o": ("openai", call_openai),
+    "gemini-pro": ("google", call_google),
+    "llama-3.1": ("together", call_together),
 }
 
 
+# A fenced ```json (or bare ```) block around the jury's JSON object
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
 def parse_jury_response(response: str) -> dict:
-    """Parse JSON response from jury model"""
-    # Try to extract JSON from response
-    try:
-        # Handle markdown code blocks
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0]
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0]
+    """Parse JSON response from jury model
+
+    Only the first fenced block is used when the reply contains several:
+
+    >>> parse_jury_response('```json\\n{"winner": "A"}\\n```\\nor\\n```json\\n{"winner": "B"}\\n```')
+    {'winner': 'A'}
+    """
+    # Extract the JSON object with one match or slice, without copying
+    # the response through intermediate splits
+    match = JSON_FENCE_RE.search(response)
+    if match:
+        payload = match.group(1)
+    else:
+        start = response.find("{")
+        end = response.rfind("}")
+        payload = response[start:end + 1] if 0 <= start < end else response
 
-        return json.loads(response.strip())
+    try:
+        return parse_json(payload)
     except json.JSONDecodeError:
         return {"error": "Failed to parse response", "raw": response}
 
 
-def run_jury_evaluation(
+# Cached verdicts older than this are ignored and re-requested
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+def cache_key(jury_name: str, prompt: str, config: dict) -> str:
+    """Hash everything that shapes a jury's verdict into a cache key"""
+    temperature = config["settings"].get("jury_temperature", 0.1)
+    payload = "\0".join((
+        jury_name,
+        JURY_MODEL_IDS[jury_name],
+        repr(temperature),
+        JURY_INSTRUCTIONS,
+        prompt
+    )).encode()
+    digest = hashlib.blake2b(payload, digest_size=16)
+    return digest.hexdigest()
+
+
+def get_cache_path(key: str) -> Path:
+    """Location of a cached jury response, sharded by hash prefix"""
+    return OUTPUTS / "_cache" / "jury" / key[:2] / f"{key}.json"
+
+
+def load_cached_response(key: str) -> Optional[str]:
+    """Return a cached jury response, or None on a miss or expired entry"""
+    cache_path = get_cache_path(key)
+    if not cache_path.exists():
+        return None
+
+    try:
+        entry = parse_json(cache_path.read_bytes())
+    except json.JSONDecodeError:
+        return None
+
+    if time.time() - entry.get("ts", 0) > CACHE_TTL_SECONDS:
+        return None
+    return entry.get("response")
+
+
+def save_cached_response(key: str, jury_name: str, response: str):
+    """Write a cache entry atomically so an interrupted run can't corrupt it"""
+    cache_path = get_cache_path(key)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(cache_path, dump_json({"jury_model": jury_name, "ts": time.time(), "response": response}))
+
+
+# Jury requests currently in flight, keyed like the response cache
+INFLIGHT = {}
+
+
+async def call_jury(jury_name: str, prompt: str, config: dict, use_cache: bool = True) -> str:
+    """Return the jury's raw response, sharing one request between identical calls"""
+    key = cache_key(jury_name, prompt, config)
+
+    # Concurrent identical requests wait on the first one instead of
+    # spending another API call; the entry is dropped once it settles
+    if key not in INFLIGHT:
+        INFLIGHT[key] = asyncio.ensure_future(fetch_jury_response(key, jury_name, prompt, config, use_cache))
+        INFLIGHT[key].add_done_callback(lambda _: INFLIGHT.pop(key, None))
+    return await INFLIGHT[key]
+
+
+async def fetch_jury_response(key: str, jury_name: str, prompt: str, config: dict, use_cache: bool) -> str:
+    """Return the jury's raw response, from the cache when possible"""
+    if use_cache:
+        cached = await asyncio.to_thread(load_cached_response, key)
+        if cached is not None:
+            return cached
+
+    raw_response = await JURY_REGISTRY[jury_name][1](prompt, config)
+
+    # Only cache verdicts that parsed, so failures get retried next run
+    if use_cache and "error" not in parse_jury_response(raw_response):
+        await asyncio.to_thread(save_cached_response, key, jury_name, raw_response)
+    return raw_response
+
+
+def vanilla_first(run_id: str, skill_id: str, test_id: str, jury_name: str) -> bool:
+    """Decide A/B placement from a hash, so reruns put responses in the same slots"""
+    # Salting with test_id and jury_name still spreads vanilla evenly across
+    # both positions, which is what guards against position bias
+    salt = "/".join((run_id, skill_id, test_id, jury_name)).encode()
+    return hashlib.blake2b(salt, digest_size=1).digest()[0] & 1 == 0
+
+
+async def run_jury_evaluation(
+    run_id: str,
+    skill_id: str,
+    test_id: str,
     task_prompt: str,
     vanilla_output: str,
     skilled_output: str,
     jury_name: str,
-    config: dict
+    config: dict,
+    use_cache: bool = True
 ) -> dict:
-    """Run a single jury evaluation with randomized A/B positioning"""
+    """Run a single jury evaluation with hash-randomized A/B positioning"""
 
-    # Randomize position
-    if random.random() < 0.5:
+    if vanilla_first(run_id, skill_id, test_id, jury_name):
         response_a = vanilla_output
         response_b = skilled_output
         position_map = {"A": "vanilla", "B": "skilled"}
@@ -257,18 +552,18 @@ def run_jury_evaluation(
         response_b = vanilla_output
         position_map = {"A": "skilled", "B": "vanilla"}
 
-    prompt = JURY_PROMPT_TEMPLATE.format(
-        task_prompt=task_prompt,
-        response_a=response_a,
-        response_b=response_b
-    )
+    prompt = "".join((
+        PROMPT_PRE_TASK, task_prompt,
+        PROMPT_PRE_A, response_a,
+        PROMPT_PRE_B, response_b,
+        PROMPT_POST
+    ))
 
     # Call the appropriate jury model
-    caller = JURY_CALLERS.get(jury_name)
-    if not caller:
+    if jury_name not in JURY_REGISTRY:
         return {"error": f"Unknown jury model: {jury_name}"}
 
-    raw_response = caller(prompt, config)
+    raw_response = await call_jury(jury_name, prompt, config, use_cache)
     parsed = parse_jury_response(raw_response)
 
     # Add position mapping to result
@@ -280,33 +575,83 @@ def run_jury_evaluation(
 
 def save_jury_scores(run_id: str, skill_id: str, test_id: str, jury_name: str, scores: dict):
     """Save jury scores to file"""
-    output_dir = Path(__file__).parent.parent / "outputs" / run_id / "jury-scores"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = OUTPUTS / run_id / "jury-scores" / f"{skill_id}_{test_id}_{jury_name}.json"
+    output_file.write_bytes(dump_json(scores, indent=True))
 
-    output_file = output_dir / f"{skill_id}_{test_id}_{jury_name}.json"
-    with open(output_file, "w") as f:
-        json.dump(scores, f, indent=2)
+
+def has_completed_scores(run_id: str, skill_id: str, test_id: str, jury_name: str) -> bool:
+    """Check for a saved score file that parses and isn't an error"""
+    score_file = OUTPUTS / run_id / "jury-scores" / f"{skill_id}_{test_id}_{jury_name}.json"
+    if not score_file.exists():
+        return False
+
+    try:
+        scores = parse_json(score_file.read_bytes())
+    except json.JSONDecodeError:
+        return False
+    return isinstance(scores, dict) and "error" not in scores
 
 
 def update_metadata(run_id: str, jury_models_used: list):
     """Update run metadata with jury completion status"""
-    metadata_path = Path(__file__).parent.parent / "outputs" / run_id / "metadata.json"
+    metadata_path = OUTPUTS / run_id / "metadata.json"
 
-    with open(metadata_path) as f:
-        metadata = json.load(f)
+    metadata = parse_json(metadata_path.read_bytes())
 
     metadata["jury_completed"] = datetime.now().isoformat()
     metadata["jury_models_used"] = jury_models_used
     metadata["status"] = "jury_complete"
 
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    # Written once per run, via rename so an interrupt can't truncate it
+    write_atomic(metadata_path, dump_json(metadata, indent=True))
+
+
+async def evaluate_and_save(
+    run_id: str,
+    skill_id: str,
+    test_id: str,
+    task_prompt: str,
+    vanilla_output: str,
+    skilled_output: str,
+    jury_name: str,
+    config: dict,
+    use_cache: bool = True
+) -> tuple:
+    """Run one jury evaluation, persist the scores and return (ok, summary)"""
+    scores = await run_jury_evaluation(
+        run_id,
+        skill_id,
+        test_id,
+        task_prompt,
+        vanilla_output,
+        skilled_output,
+        jury_name,
+        config,
+        use_cache
+    )
+
+    if "error" in scores:
+        summary = f"{skill_id}/{test_id} - {jury_name}: ERROR: {scores['error']}"
+    else:
+        # Determine actual winner
+        winner_position = scores.get("winner", "Tie")
+        if winner_position in ("A", "B"):
+            actual_winner = scores["position_map"].get(winner_position, "unknown")
+        else:
+            actual_winner = "tie"
+
+        summary = f"{skill_id}/{test_id} - {jury_name}: Winner: {actual_winner}"
+
+    await asyncio.to_thread(save_jury_scores, run_id, skill_id, test_id, jury_name, scores)
+    return "error" not in scores, summary
 
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="Run jury scoring on contestant outputs")
     parser.add_argument("--run-id", required=True, help="Run ID from contestant phase")
     parser.add_argument("--jury", help="Comma-separated jury models (default: all configured)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached jury responses")
+    parser.add_argument("--resume", action="store_true", help="Skip evaluations that already have valid scores")
     args = parser.parse_args()
 
     config = load_config()
@@ -321,13 +666,8 @@ def main():
     # Filter to models with API keys
     available_jury = []
     for jm in jury_models:
-        if jm == "claude-opus" and config["api_keys"].get("anthropic"):
-            available_jury.append(jm)
-        elif jm == "gpt-4o" and config["api_keys"].get("openai"):
-            available_jury.append(jm)
-        elif jm == "gemini-pro" and config["api_keys"].get("google"):
-            available_jury.append(jm)
-        elif jm == "llama-3.1" and config["api_keys"].get("together"):
+        entry = JURY_REGISTRY.get(jm)
+        if entry and config["api_keys"].get(entry[0]):
             available_jury.append(jm)
         else:
             print(f"Warning: Skipping {jm} - no API key configured")
@@ -343,41 +683,60 @@ def main():
     print(f"Test Cases: {len(metadata['test_cases'])}")
     print(f"{'='*60}\n")
 
+    init_clients(config)
+    (OUTPUTS / args.run_id / "jury-scores").mkdir(parents=True, exist_ok=True)
+
+    # Cap in-flight calls per provider to stay under its rate limits
+    concurrency = config["settings"].get("jury_concurrency", {})
+    for provider in ("anthropic", "openai", "google", "together"):
+        SEMAPHORES[provider] = asyncio.Semaphore(concurrency.get(provider, 8))
+
+    # Read every contestant output up front so the jury phase is network-bound
+    contestant_outputs = load_contestant_outputs(args.run_id)
+
+    # Every (test case, jury) pair is independent, so run them all concurrently
+    tasks = []
+    skipped = 0
     for test_case in metadata["test_cases"]:
         skill_id = test_case["skill_id"]
         test_id = test_case["test_id"]
         task_prompt = test_case["prompt"]
-
-        print(f"\n--- {skill_id}/{test_id} ---")
-
-        # Load contestant outputs
-        vanilla_output = load_contestant_output(args.run_id, skill_id, test_id, "vanilla")
-        skilled_output = load_contestant_output(args.run_id, skill_id, test_id, "skilled")
+        vanilla_output = get_contestant_output(contestant_outputs, args.run_id, skill_id, test_id, "vanilla")
+        skilled_output = get_contestant_output(contestant_outputs, args.run_id, skill_id, test_id, "skilled")
 
         for jury_name in available_jury:
-            print(f"  Jury: {jury_name}...", end=" ", flush=True)
-
-            scores = run_jury_evaluation(
+            if args.resume and has_completed_scores(args.run_id, skill_id, test_id, jury_name):
+                skipped += 1
+                continue
+
+            tasks.append(evaluate_and_save(
+                args.run_id,
+                skill_id,
+                test_id,
                 task_prompt,
                 vanilla_output,
                 skilled_output,
                 jury_name,
-                config
-            )
-
-            if "error" in scores:
-                print(f"ERROR: {scores['error']}")
-            else:
-                # Determine actual winner
-                winner_position = scores.get("winner", "Tie")
-                if winner_position in ("A", "B"):
-                    actual_winner = scores["position_map"].get(winner_position, "unknown")
-                else:
-                    actual_winner = "tie"
-
-                print(f"Winner: {actual_winner}")
-
-            save_jury_scores(args.run_id, skill_id, test_id, jury_name, scores)
+                config,
+                use_cache=not args.no_cache
+            ))
+
+    if skipped:
+        print(f"Resuming: skipping {skipped} completed evaluations\n")
+
+    # Report from the event loop as each evaluation lands. With tqdm this
+    # is a throttled progress bar plus error lines; otherwise one line each.
+    progress = tqdm(total=len(tasks), unit="eval", desc="Jury") if tqdm else None
+    for done, future in enumerate(asyncio.as_completed(tasks), 1):
+        ok, summary = await future
+        if progress:
+            if not ok:
+                progress.write(f"  {summary}")
+            progress.update()
+        else:
+            print(f"  [{done}/{len(tasks)}] {summary}")
+    if progress:
+        progress.close()
 
     # Update metadata
     update_metadata(args.run_id, available_jury)
@@ -390,4 +749,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())